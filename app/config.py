@@ -1,4 +1,5 @@
 import os
+
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 from functools import lru_cache
@@ -7,39 +8,59 @@ from functools import lru_cache
 load_dotenv()
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
-    
+    """
+    Application settings loaded from environment variables.
+
+    pydantic-settings reads each field from the environment by name, so
+    the environment is parsed once at construction instead of through
+    repeated os.getenv calls.
+    """
+
     # API Configuration
     API_TITLE: str = "Meeting Transcript Summarizer"
     API_DESCRIPTION: str = "API for summarizing meeting transcripts using AI"
     API_VERSION: str = "1.0.0"
-    
+
     # Server Configuration
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
-    
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    DEBUG: bool = False
+    # Multi-worker runs require the Redis job store; the in-memory store
+    # is per-process, so the default stays at a single worker
+    WORKERS: int = 1
+
     # CORS Settings
-    CORS_ORIGINS: list = ["*"]  
-    
+    CORS_ORIGINS: list = ["*"]
+
     # API Keys
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    ANTHROPIC_API_KEY: str = os.getenv("ANTHROPIC_API_KEY", "")
-    
+    OPENAI_API_KEY: str = ""
+    ANTHROPIC_API_KEY: str = ""
+
     # AI Models
-    OPENAI_CHUNK_MODEL: str = os.getenv("OPENAI_CHUNK_MODEL", "gpt-4o")
-    OPENAI_FINAL_MODEL: str = os.getenv("OPENAI_FINAL_MODEL", "gpt-4o")
-    ANTHROPIC_CHUNK_MODEL: str = os.getenv("ANTHROPIC_CHUNK_MODEL", "claude-3-haiku-20240307")
-    ANTHROPIC_FINAL_MODEL: str = os.getenv("ANTHROPIC_FINAL_MODEL", "claude-3-5-sonnet-20240620")
-    
+    OPENAI_CHUNK_MODEL: str = "gpt-4o"
+    OPENAI_FINAL_MODEL: str = "gpt-4o"
+    ANTHROPIC_CHUNK_MODEL: str = "claude-3-haiku-20240307"
+    ANTHROPIC_FINAL_MODEL: str = "claude-3-5-sonnet-20240620"
+
+    # Maximum number of concurrent LLM calls per job
+    MAX_CONCURRENCY: int = 8
+
     # Chunking Configuration
-    TARGET_CHUNKS: int = int(os.getenv("TARGET_CHUNKS", "10"))
-    MIN_CHUNK_SIZE: int = int(os.getenv("MIN_CHUNK_SIZE", "50"))
-    MAX_CHUNK_SIZE: int = int(os.getenv("MAX_CHUNK_SIZE", "100"))
-    DEFAULT_CHUNK_OVERLAP: int = int(os.getenv("DEFAULT_CHUNK_OVERLAP", "5"))
-    
+    TARGET_CHUNKS: int = 10
+    MIN_CHUNK_SIZE: int = 50
+    MAX_CHUNK_SIZE: int = 100
+    DEFAULT_CHUNK_OVERLAP: int = 5
+
+    # Summary Cache Configuration
+    SUMMARY_CACHE_ENABLED: bool = True
+    SUMMARY_CACHE_SIMILARITY: float = 0.97
+    SUMMARY_CACHE_DIR: str = ""
+    SUMMARY_CACHE_MAX_ENTRIES: int = 10000
+
     # Job Configuration
-    JOB_EXPIRY_HOURS: int = int(os.getenv("JOB_EXPIRY_HOURS", "24"))
+    JOB_EXPIRY_HOURS: int = 24
+    JOB_STORE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
     
     class Config:
         env_file = ".env"
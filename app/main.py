@@ -1,12 +1,17 @@
-import json
+import asyncio
+import itertools
 import logging
+import os
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, Optional, Union
 
+import httpx
+import orjson
+
 from fastapi import FastAPI, HTTPException, File, UploadFile, BackgroundTasks, Depends, status, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.config import get_settings
 from app.models import (
@@ -16,7 +21,8 @@ from app.models import (
     SummaryOrStatus,
     ProcessingOptions
 )
-from app.services.ai_client import get_ai_client
+from app.services.ai_client import aclose_ai_clients, get_ai_client
+from app.services.job_store import get_job_store
 from app.services.summarizer import TranscriptSummarizer
 from app.utils.helpers import sanitize_transcript_data
 
@@ -35,6 +41,7 @@ app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -46,34 +53,97 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory store for job status (use a proper DB in production)
-jobs = {}
+# Shared HTTP client for fetching transcripts, created on startup and
+# reused across requests to avoid per-request connection setup
+http_client: Optional[httpx.AsyncClient] = None
+
+# Job store for tracking asynchronous jobs (in-memory by default,
+# Redis when configured for multi-worker deployments)
+job_store = get_job_store()
+
+# Job IDs combine a per-process prefix with a monotonic counter so two
+# requests can never collide. The PID is included because uvicorn forks
+# all workers within the same second, and with a shared job store the
+# timestamp alone would give every worker the same ID sequence.
+_job_prefix = f"job-{int(time.time())}-{os.getpid()}"
+_job_counter = itertools.count()
+
+def next_job_id() -> str:
+    """
+    Generate a unique job ID for this process.
+
+    Returns:
+        A job ID of the form "job-<startup epoch>-<pid>-<sequence>"
+    """
+    return f"{_job_prefix}-{next(_job_counter)}"
 
 # Function to periodically clean up expired jobs
-def cleanup_expired_jobs():
+async def cleanup_expired_jobs():
     """
-    Remove expired jobs from the jobs dictionary.
+    Remove expired jobs from the job store.
     Expired jobs are those older than settings.JOB_EXPIRY_HOURS.
     """
-    current_time = datetime.now()
-    expiry_threshold = current_time - timedelta(hours=settings.JOB_EXPIRY_HOURS)
-    
-    # Identify expired jobs
-    expired_job_ids = []
-    for job_id, job_data in jobs.items():
-        created_at = job_data.get("created_at")
-        if created_at and datetime.fromisoformat(created_at) < expiry_threshold:
-            expired_job_ids.append(job_id)
-    
-    # Remove expired jobs
-    for job_id in expired_job_ids:
-        del jobs[job_id]
-    
-    if expired_job_ids:
-        logger.info(f"Cleaned up {len(expired_job_ids)} expired jobs")
+    cleaned = await job_store.cleanup_expired()
+    if cleaned:
+        logger.info(f"Cleaned up {cleaned} expired jobs")
+
+# Lock to guard against overlapping cleanup runs
+_cleanup_lock = asyncio.Lock()
+
+# Interval between cleanup runs, in seconds
+CLEANUP_INTERVAL_SECONDS = 60
+
+async def _cleanup_loop():
+    """
+    Periodically remove expired jobs in the background.
+
+    Runs for the lifetime of the application so cleanup never adds
+    latency to individual requests.
+    """
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        async with _cleanup_lock:
+            await cleanup_expired_jobs()
+
+# Strong reference to the cleanup task; the event loop only holds weak
+# references, so an unreferenced task could be garbage-collected and
+# the cleanup loop would silently stop
+_cleanup_task: Optional[asyncio.Task] = None
+
+@app.on_event("startup")
+async def start_cleanup_task():
+    """Start the periodic job cleanup task on application startup."""
+    global _cleanup_task
+    _cleanup_task = asyncio.create_task(_cleanup_loop())
+
+@app.on_event("shutdown")
+async def stop_cleanup_task():
+    """Cancel the periodic job cleanup task on application shutdown."""
+    if _cleanup_task is not None:
+        _cleanup_task.cancel()
+
+@app.on_event("startup")
+async def create_http_client():
+    """Create the shared HTTP client on application startup."""
+    global http_client
+    http_client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=50)
+    )
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close the shared HTTP client on application shutdown."""
+    if http_client is not None:
+        await http_client.aclose()
+
+@app.on_event("shutdown")
+async def close_ai_clients():
+    """Close the AI clients' connection pools on application shutdown."""
+    await aclose_ai_clients()
 
 # Function to update job status
-def update_job_status(
+async def update_job_status(
     job_id: str, 
     status: str, 
     progress: Optional[float] = None, 
@@ -90,17 +160,17 @@ def update_job_status(
         result: Optional result dictionary
         error: Optional error message
     """
-    if job_id in jobs:
-        if status:
-            jobs[job_id]["status"] = status
-        if progress is not None:
-            jobs[job_id]["progress"] = progress
-        if result is not None:
-            jobs[job_id]["result"] = result
-        if error is not None:
-            jobs[job_id]["error"] = error
-        
-        jobs[job_id]["updated_at"] = datetime.now().isoformat()
+    fields = {"updated_at": datetime.now()}
+    if status:
+        fields["status"] = status
+    if progress is not None:
+        fields["progress"] = progress
+    if result is not None:
+        fields["result"] = result
+    if error is not None:
+        fields["error"] = error
+
+    await job_store.update(job_id, fields)
 
 async def process_transcript_in_background(
     transcript_data: Dict, 
@@ -132,7 +202,7 @@ async def process_transcript_in_background(
         )
     except Exception as e:
         logger.error(f"Background task error: {str(e)}")
-        update_job_status(job_id, "failed", error=str(e))
+        await update_job_status(job_id, "failed", error=str(e))
 
 @app.post("/summarize_transcript/", response_model=SummaryOrStatus)
 async def api_summarize_transcript(
@@ -152,30 +222,29 @@ async def api_summarize_transcript(
         Either the summary directly, or a job ID for async processing
     """
     try:
-        # Clean up expired jobs
-        cleanup_expired_jobs()
-        
-        # Fetch the transcript data
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(str(request.transcript_url))
-            response.raise_for_status()
-            transcript_data = response.json()
+        # Fetch the transcript data using the shared HTTP client
+        response = await http_client.get(str(request.transcript_url))
+        response.raise_for_status()
+        transcript_data = orjson.loads(response.content)
         
         # Sanitize and validate transcript data
         transcript_data = sanitize_transcript_data(transcript_data)
         
         if options.async_mode:
             # Generate a job ID and start processing in the background
-            job_id = f"job-{int(time.time())}"
-            jobs[job_id] = {
+            job_id = next_job_id()
+            created_at_ts = time.time()
+            now = datetime.now()
+            await job_store.create(job_id, {
                 "status": "queued",
                 "progress": 0,
                 "result": None,
                 "error": None,
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-            
+                "created_at_ts": created_at_ts,
+                "created_at": now,
+                "updated_at": now
+            })
+
             background_tasks.add_task(
                 process_transcript_in_background, 
                 transcript_data, 
@@ -188,8 +257,8 @@ async def api_summarize_transcript(
                 job_id=job_id,
                 status="queued",
                 progress=0,
-                created_at=datetime.fromisoformat(jobs[job_id]["created_at"]),
-                updated_at=datetime.fromisoformat(jobs[job_id]["updated_at"])
+                created_at=now,
+                updated_at=now
             )
         else:
             # Get AI client
@@ -218,7 +287,7 @@ async def api_summarize_transcript(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Service unavailable: {e}"
         )
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Invalid JSON format in response")
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -237,6 +306,81 @@ async def api_summarize_transcript(
             detail=f"Error processing request: {str(e)}"
         )
 
+@app.post("/summarize_transcript/stream")
+async def api_summarize_transcript_stream(
+    request: TranscriptRequest,
+    options: ProcessingOptions = Depends()
+):
+    """
+    Summarize a transcript from a URL and stream the final summary.
+
+    The final summary is forwarded as Server-Sent Events as it is
+    generated, so clients see output without waiting for the full
+    completion.
+
+    Args:
+        request: The request containing the transcript URL
+        options: Processing options
+
+    Returns:
+        A StreamingResponse emitting the final summary as SSE
+    """
+    try:
+        # Fetch the transcript data using the shared HTTP client
+        response = await http_client.get(str(request.transcript_url))
+        response.raise_for_status()
+        transcript_data = orjson.loads(response.content)
+
+        # Sanitize and validate transcript data
+        transcript_data = sanitize_transcript_data(transcript_data)
+
+        # Get AI client
+        ai_client = get_ai_client(options.ai_provider)
+
+        # Initialize summarizer
+        summarizer = TranscriptSummarizer(ai_client)
+
+        async def event_stream():
+            async for piece in summarizer.summarize_stream(transcript_data):
+                # Each piece is sent as a JSON string: a raw newline in
+                # the payload would end the SSE data line early and
+                # corrupt the event for clients
+                yield b"data: " + orjson.dumps(piece) + b"\n\n"
+            yield b"data: [DONE]\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP error occurred: {e}")
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Failed to fetch transcript data: {e}"
+        )
+    except httpx.RequestError as e:
+        logger.error(f"Request error occurred: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Service unavailable: {e}"
+        )
+    except orjson.JSONDecodeError:
+        logger.error("Invalid JSON format in response")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid JSON format in the response"
+        )
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error in api_summarize_transcript_stream: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error processing request: {str(e)}"
+        )
+
 @app.post("/summarize_transcript_file/", response_model=SummaryOrStatus)
 async def api_summarize_transcript_file(
     file: UploadFile = File(...),
@@ -255,9 +399,6 @@ async def api_summarize_transcript_file(
         Either the summary directly, or a job ID for async processing
     """
     try:
-        # Clean up expired jobs
-        cleanup_expired_jobs()
-        
         # Ensure the uploaded file is a .json file
         if file.content_type != 'application/json':
             raise HTTPException(
@@ -265,32 +406,41 @@ async def api_summarize_transcript_file(
                 detail="Invalid file type. Please upload a .json file."
             )
 
-        # Read the uploaded file
-        content = await file.read()
-        
+        # Read the uploaded file in 1 MB pieces to avoid materializing a
+        # second full copy of large transcripts
+        buf = bytearray()
+        while chunk := await file.read(1 << 20):
+            buf.extend(chunk)
+
         try:
-            transcript_data = json.loads(content)
-        except json.JSONDecodeError:
+            transcript_data = orjson.loads(memoryview(buf))
+        except orjson.JSONDecodeError:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid JSON format in the uploaded file."
             )
+        finally:
+            # Drop the raw bytes before the (potentially long) sanitize step
+            del buf
 
         # Sanitize and validate transcript data
         transcript_data = sanitize_transcript_data(transcript_data)
         
         if options.async_mode:
             # Generate a job ID and start processing in the background
-            job_id = f"job-{int(time.time())}"
-            jobs[job_id] = {
+            job_id = next_job_id()
+            created_at_ts = time.time()
+            now = datetime.now()
+            await job_store.create(job_id, {
                 "status": "queued",
                 "progress": 0,
                 "result": None,
                 "error": None,
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-            
+                "created_at_ts": created_at_ts,
+                "created_at": now,
+                "updated_at": now
+            })
+
             background_tasks.add_task(
                 process_transcript_in_background, 
                 transcript_data, 
@@ -303,8 +453,8 @@ async def api_summarize_transcript_file(
                 job_id=job_id,
                 status="queued",
                 progress=0,
-                created_at=datetime.fromisoformat(jobs[job_id]["created_at"]),
-                updated_at=datetime.fromisoformat(jobs[job_id]["updated_at"])
+                created_at=now,
+                updated_at=now
             )
         else:
             # Get AI client
@@ -336,34 +486,36 @@ async def api_summarize_transcript_file(
             detail=f"Error processing request: {str(e)}"
         )
 
-@app.get("/job/{job_id}", response_model=ProcessingStatus)
+@app.get("/job/{job_id}")
 async def get_job_status(job_id: str):
     """
     Get the status of an asynchronous job.
-    
+
+    Returns a raw ORJSONResponse rather than going through Pydantic
+    response validation, since this endpoint is polled frequently.
+
     Args:
         job_id: The job ID
         
     Returns:
         The job status
     """
-    if job_id not in jobs:
+    job_data = await job_store.get(job_id)
+    if job_data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job with ID {job_id} not found"
         )
     
-    job_data = jobs[job_id]
-    
-    return ProcessingStatus(
-        job_id=job_id,
-        status=job_data["status"],
-        progress=job_data["progress"],
-        result=job_data["result"],
-        error=job_data["error"],
-        created_at=datetime.fromisoformat(job_data["created_at"]) if "created_at" in job_data else None,
-        updated_at=datetime.fromisoformat(job_data["updated_at"]) if "updated_at" in job_data else None
-    )
+    return ORJSONResponse(content={
+        "job_id": job_id,
+        "status": job_data["status"],
+        "progress": job_data["progress"],
+        "result": job_data["result"],
+        "error": job_data["error"],
+        "created_at": job_data.get("created_at"),
+        "updated_at": job_data.get("updated_at")
+    })
 
 @app.get("/health")
 def health_check():
@@ -373,7 +525,7 @@ def health_check():
     Returns:
         Health status
     """
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return ORJSONResponse(content={"status": "healthy", "timestamp": datetime.now()})
 
 @app.get("/")
 def root():
@@ -383,9 +535,9 @@ def root():
     Returns:
         API information
     """
-    return {
+    return ORJSONResponse(content={
         "name": settings.API_TITLE,
         "version": settings.API_VERSION,
         "docs_url": "/docs",
         "health_check": "/health"
-    }
\ No newline at end of file
+    })
\ No newline at end of file
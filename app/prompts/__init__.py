@@ -0,0 +1,31 @@
+"""
+System prompts for the AI clients.
+
+The prompts live in plain text files next to this module and are read
+lazily on first use, so process start does not pay for parsing
+multi-kilobyte string constants and workers that never hit a given path
+never load its prompt.
+"""
+
+from functools import lru_cache
+from importlib import resources
+
+@lru_cache(maxsize=None)
+def get_chunk_system_message() -> str:
+    """
+    Get the system message for chunk summarization.
+
+    Returns:
+        The chunk summarization system prompt
+    """
+    return resources.files("app.prompts").joinpath("chunk_system.txt").read_text(encoding="utf-8")
+
+@lru_cache(maxsize=None)
+def get_final_system_message() -> str:
+    """
+    Get the system message for final summary synthesis.
+
+    Returns:
+        The final summary system prompt
+    """
+    return resources.files("app.prompts").joinpath("final_system.txt").read_text(encoding="utf-8")
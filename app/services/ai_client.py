@@ -1,21 +1,26 @@
+import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Any
-import os
-from openai import OpenAI
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import Dict, Optional, List, Any, AsyncIterator
 
-# Import prompts
-import prompt
+import httpx
+from openai import AsyncOpenAI
+
+from app.config import get_settings
+from app.prompts import get_chunk_system_message, get_final_system_message
+from app.services.summary_cache import get_summary_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-
 class AIClient(ABC):
     """Abstract base class for AI provider clients."""
+
+    async def aclose(self) -> None:
+        """Release any underlying network resources."""
+        pass
     
     @abstractmethod
     async def generate_summary(self, prompt_text: str) -> str:
@@ -34,15 +39,28 @@ class AIClient(ABC):
     async def generate_final_summary(self, summaries_text: str) -> str:
         """
         Generate a final summary from multiple chunk summaries.
-        
+
         Args:
             summaries_text: The combined chunk summaries
-            
+
         Returns:
             The final summary
         """
         pass
 
+    @abstractmethod
+    def generate_final_summary_stream(self, summaries_text: str) -> AsyncIterator[str]:
+        """
+        Stream a final summary from multiple chunk summaries.
+
+        Args:
+            summaries_text: The combined chunk summaries
+
+        Yields:
+            Pieces of the final summary as they are generated
+        """
+        pass
+
 class OpenAIClient(AIClient):
     """Client for interacting with OpenAI's API."""
     
@@ -59,13 +77,38 @@ class OpenAIClient(AIClient):
             final_summary_model: Model to use for the final summary
         """
         # Validate API key
-        api_key = os.getenv("OPENAI_API_KEY")
+        api_key = get_settings().OPENAI_API_KEY
         if not api_key:
             raise ValueError("OpenAI API key is missing. Please set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI()
+        # Share one HTTP/2 connection pool across all completion calls so
+        # parallel chunk requests multiplex over a few TLS sessions
+        # instead of opening a connection per request
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(120.0)
+        )
+        self.client = AsyncOpenAI(http_client=self._http_client)
         self.chunk_summary_model = chunk_summary_model
         self.final_summary_model = final_summary_model
+
+        # Bind the system messages once so the hot request path avoids
+        # repeated lookups
+        self._system_message = get_chunk_system_message()
+        self._final_system_message = get_final_system_message()
+
+        # OpenAI's prompt cache is keyed on the exact request prefix, so
+        # the system message must stay first and byte-identical across
+        # calls. Log stable fingerprints to make accidental prompt
+        # mutations visible across deploys.
+        chunk_hash = hashlib.blake2b(self._system_message.encode()).hexdigest()
+        final_hash = hashlib.blake2b(self._final_system_message.encode()).hexdigest()
+        logger.info(f"System prompt fingerprints: chunk={chunk_hash[:16]} final={final_hash[:16]}")
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self._http_client.aclose()
     
     async def generate_summary(self, prompt_text: str) -> str:
         """
@@ -80,16 +123,32 @@ class OpenAIClient(AIClient):
         Raises:
             Exception: If the API call fails
         """
+        # Serve repeated chunk content from the cache without an LLM
+        # call. Cache construction and lookups may load and run the
+        # embedding model, so they are offloaded to a worker thread
+        # instead of blocking the event loop.
+        cache = await asyncio.to_thread(get_summary_cache)
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.get, prompt_text)
+            if cached is not None:
+                logger.info("Chunk summary served from cache")
+                return cached
+
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.chunk_summary_model,
                 messages=[
-                    {"role": "system", "content": prompt.system_message},
+                    {"role": "system", "content": self._system_message},
                     {"role": "user", "content": prompt_text}
                 ],
                 temperature=0
             )
-            return response.choices[0].message.content
+            summary = response.choices[0].message.content
+
+            if cache is not None:
+                await asyncio.to_thread(cache.put, prompt_text, summary)
+
+            return summary
         except Exception as e:
             logger.error(f"Error generating summary with OpenAI: {str(e)}")
             raise
@@ -108,10 +167,10 @@ class OpenAIClient(AIClient):
             Exception: If the API call fails
         """
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.final_summary_model,
                 messages=[
-                    {"role": "system", "content": prompt.final_system_message},
+                    {"role": "system", "content": self._final_system_message},
                     {"role": "user", "content": summaries_text}
                 ],
                 temperature=0
@@ -121,6 +180,36 @@ class OpenAIClient(AIClient):
             logger.error(f"Error generating final summary with OpenAI: {str(e)}")
             raise
 
+    async def generate_final_summary_stream(self, summaries_text: str) -> AsyncIterator[str]:
+        """
+        Stream a final summary using OpenAI.
+
+        Args:
+            summaries_text: The combined chunk summaries
+
+        Yields:
+            Pieces of the final summary as they arrive from the API
+
+        Raises:
+            Exception: If the API call fails
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.final_summary_model,
+                messages=[
+                    {"role": "system", "content": self._final_system_message},
+                    {"role": "user", "content": summaries_text}
+                ],
+                temperature=0,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error(f"Error streaming final summary with OpenAI: {str(e)}")
+            raise
+
 # Commented out but available when needed
 """
 class AnthropicClient(AIClient):
@@ -165,7 +254,13 @@ class AnthropicClient(AIClient):
                 model=self.chunk_summary_model,
                 max_tokens=4000,
                 temperature=0,
-                system=prompt.system_message,
+                system=[
+                    {
+                        "type": "text",
+                        "text": get_chunk_system_message(),
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
                 messages=[
                     {
                         "role": "user",
@@ -196,7 +291,13 @@ class AnthropicClient(AIClient):
                 model=self.final_summary_model,
                 max_tokens=8192,
                 temperature=0,
-                system=prompt.final_system_message,
+                system=[
+                    {
+                        "type": "text",
+                        "text": get_final_system_message(),
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
                 messages=[
                     {
                         "role": "user",
@@ -216,21 +317,36 @@ class AnthropicClient(AIClient):
             raise
 """
 
+# Clients handed out by get_ai_client, tracked so their connection
+# pools can be closed on application shutdown
+_active_clients: List[AIClient] = []
+
+async def aclose_ai_clients() -> None:
+    """Close the connection pools of all constructed AI clients."""
+    for client in _active_clients:
+        await client.aclose()
+
+@lru_cache(maxsize=4)
 def get_ai_client(provider: str = "openai") -> AIClient:
     """
     Factory function to get the appropriate AI client based on provider.
-    
+
+    The client is cached per provider, so the underlying SDK client and
+    its connection pool are constructed once and reused across requests.
+
     Args:
         provider: The AI provider to use ("openai" or "anthropic")
-        
+
     Returns:
         An instance of the appropriate AIClient subclass
-        
+
     Raises:
         ValueError: If an unsupported provider is specified
     """
     if provider.lower() == "openai":
-        return OpenAIClient()
+        client = OpenAIClient()
+        _active_clients.append(client)
+        return client
     elif provider.lower() == "anthropic":
         # Uncomment when needed
         # return AnthropicClient()
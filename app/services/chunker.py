@@ -1,72 +1,101 @@
-import math
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator
 
-from app.utils.helpers import create_prompt
+from app.utils.helpers import TranscriptColumns, build_static_suffix, create_prompt
 
+@lru_cache(maxsize=1024)
 def determine_chunk_size(
-    total_utterances: int, 
-    target_chunks: int = 10, 
-    min_chunk_size: int = 50, 
+    total_utterances: int,
+    target_chunks: int = 10,
+    min_chunk_size: int = 50,
     max_chunk_size: int = 100
 ) -> int:
     """
     Determines the optimal chunk size for processing.
-    
+
+    Memoized on the exact argument tuple, so repeated jobs with the
+    same transcript length skip the arithmetic entirely.
+
     Args:
         total_utterances: The total number of utterances in the transcript
         target_chunks: The target number of chunks to create
         min_chunk_size: The minimum chunk size
         max_chunk_size: The maximum chunk size
-        
+
     Returns:
         The determined chunk size
     """
-    # Calculate ideal chunk size to meet target_chunks
-    ideal_chunk_size = math.ceil(total_utterances / target_chunks)
-    
+    # Calculate ideal chunk size to meet target_chunks, rounding up with
+    # integer arithmetic to avoid a float division
+    ideal_chunk_size = -(-total_utterances // target_chunks)
+
     # Ensure chunk size is within bounds
     return max(min(ideal_chunk_size, max_chunk_size), min_chunk_size)
 
+def count_chunks(total_utterances: int, chunk_size: int, overlap: int = 5) -> int:
+    """
+    Counts how many chunks process_chunks will produce.
+
+    Args:
+        total_utterances: The total number of utterances in the transcript
+        chunk_size: The size of each chunk
+        overlap: The number of utterances to overlap between chunks
+
+    Returns:
+        The number of chunks
+    """
+    chunks = 0
+    start = 0
+
+    while start < total_utterances:
+        chunks += 1
+        if start + chunk_size >= total_utterances:
+            start += chunk_size
+        else:
+            start += chunk_size - overlap
+
+    return chunks
+
 def process_chunks(
-    data: List[Dict[str, Any]],
+    columns: TranscriptColumns,
     chunk_size: int,
     speakers: List[Dict[str, Any]],
     attendees: List[Dict[str, Any]],
     overlap: int = 5
-) -> List[str]:
+) -> Iterator[str]:
     """
     Processes the transcript data into overlapping chunks with prompts.
-    
+
+    Prompts are yielded lazily so only the chunks currently being
+    processed are held in memory, rather than every prompt at once.
+
     Args:
-        data: The transcript data (list of utterances)
+        columns: The column-oriented transcript data
         chunk_size: The size of each chunk
         speakers: The speakers data
         attendees: The attendees data
         overlap: The number of utterances to overlap between chunks
-        
-    Returns:
-        A list of prompts for each chunk
+
+    Yields:
+        A prompt for each chunk
     """
-    prompts = []
+    # Format the speaker/attendee suffix once; it is identical for every chunk
+    static_suffix = build_static_suffix(speakers, attendees)
+
+    total = len(columns)
     start = 0
-    
-    while start < len(data):
+
+    while start < total:
         # Calculate end position ensuring we don't exceed data length
-        end = min(start + chunk_size, len(data))
-        
-        # Extract current chunk
-        chunk = data[start:end]
-        
-        # Create prompt for the current chunk
-        prompt = create_prompt(chunk, speakers, attendees)
-        prompts.append(prompt)
-        
+        end = min(start + chunk_size, total)
+
+        # Create prompt for the current window of the columns
+        yield create_prompt(columns, start, end, static_suffix)
+
         # Calculate next start position with overlap
         # If we're at the end, move by full chunk size to terminate the loop
-        if start + chunk_size >= len(data):
+        if start + chunk_size >= total:
             start += chunk_size
         else:
             # Otherwise, move forward by chunk_size - overlap
-            start += chunk_size - overlap
-    
-    return prompts
\ No newline at end of file
+            start += chunk_size - overlap
\ No newline at end of file
@@ -0,0 +1,223 @@
+"""
+Job store abstractions for tracking asynchronous summarization jobs.
+
+The in-memory store keeps the original single-process behavior; the
+Redis store allows running multiple uvicorn workers behind a load
+balancer, since every worker then sees the same job state. All methods
+are coroutines so the Redis backend never blocks the event loop.
+"""
+
+import heapq
+import logging
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import orjson
+
+from app.config import get_settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class JobStore(ABC):
+    """Abstract base class for job state storage backends."""
+
+    @abstractmethod
+    async def create(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """
+        Store a new job record.
+
+        Args:
+            job_id: The ID of the job
+            job_data: The initial job record; must include a
+                "created_at_ts" epoch float for expiry tracking
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a job record.
+
+        Args:
+            job_id: The ID of the job
+
+        Returns:
+            The job record, or None if the job is unknown or expired
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """
+        Merge fields into an existing job record.
+
+        Args:
+            job_id: The ID of the job
+            fields: The fields to set on the record
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        """
+        Remove a job record.
+
+        Args:
+            job_id: The ID of the job
+        """
+        pass
+
+    @abstractmethod
+    async def cleanup_expired(self) -> int:
+        """
+        Remove jobs older than the configured expiry.
+
+        Returns:
+            The number of jobs removed
+        """
+        pass
+
+class InMemoryJobStore(JobStore):
+    """
+    Job store backed by a per-process dict.
+
+    Expiry uses a min-heap of (expiry_epoch, job_id) entries so cleanup
+    only touches jobs that have actually expired rather than scanning
+    every tracked job.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        Initialize the in-memory store.
+
+        Args:
+            ttl_seconds: How long job records are kept, in seconds
+        """
+        self._ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._expiry_heap: list = []
+
+    async def create(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        self._jobs[job_id] = job_data
+        created_at_ts = job_data.get("created_at_ts", time.time())
+        heapq.heappush(self._expiry_heap, (created_at_ts + self._ttl_seconds, job_id))
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._jobs.get(job_id)
+
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        job_data = self._jobs.get(job_id)
+        if job_data is not None:
+            job_data.update(fields)
+
+    async def delete(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+
+    async def cleanup_expired(self) -> int:
+        now = time.time()
+        cleaned = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, job_id = heapq.heappop(self._expiry_heap)
+            job_data = self._jobs.get(job_id)
+            # The job may already be gone, or may have been re-registered
+            # with a fresher creation time; only delete if genuinely expired
+            if job_data and job_data.get("created_at_ts", 0) + self._ttl_seconds <= now:
+                del self._jobs[job_id]
+                cleaned += 1
+
+        return cleaned
+
+class RedisJobStore(JobStore):
+    """
+    Job store backed by Redis, for multi-worker deployments.
+
+    Uses the redis.asyncio client so store calls never block the event
+    loop. Records are Redis hashes with each field serialized as an
+    orjson blob: merging fields is a single atomic HSET, so concurrent
+    updates from different workers cannot lose each other's fields.
+    Keys carry a TTL, so Redis handles expiry itself and
+    cleanup_expired is a no-op.
+    """
+
+    KEY_PREFIX = "transcript-summarizer:job:"
+
+    def __init__(self, redis_url: str, ttl_seconds: float):
+        """
+        Initialize the Redis store.
+
+        Args:
+            redis_url: The Redis connection URL
+            ttl_seconds: How long job records are kept, in seconds
+
+        Raises:
+            ValueError: If the redis package is not installed
+        """
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise ValueError(
+                "Redis support requires the 'redis' package. "
+                "Install it or use the in-memory job store."
+            )
+
+        self._client = redis.Redis.from_url(redis_url)
+        self._ttl_seconds = int(ttl_seconds)
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, bytes]:
+        return {name: orjson.dumps(value) for name, value in fields.items()}
+
+    async def create(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job_id), mapping=self._encode(job_data))
+            pipe.expire(self._key(job_id), self._ttl_seconds)
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self._client.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return {name.decode(): orjson.loads(value) for name, value in raw.items()}
+
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        # A single HSET merges all fields atomically; no read-modify-write
+        if await self._client.exists(self._key(job_id)):
+            await self._client.hset(self._key(job_id), mapping=self._encode(fields))
+
+    async def delete(self, job_id: str) -> None:
+        await self._client.delete(self._key(job_id))
+
+    async def cleanup_expired(self) -> int:
+        # Redis expires keys via their TTL; nothing to do here
+        return 0
+
+@lru_cache()
+def get_job_store() -> JobStore:
+    """
+    Factory function to get the configured job store.
+
+    The store is cached so every caller shares one instance per process.
+
+    Returns:
+        An instance of the appropriate JobStore subclass
+
+    Raises:
+        ValueError: If an unsupported backend is configured
+    """
+    settings = get_settings()
+    ttl_seconds = settings.JOB_EXPIRY_HOURS * 3600
+
+    backend = settings.JOB_STORE_BACKEND.lower()
+    if backend == "memory":
+        return InMemoryJobStore(ttl_seconds)
+    elif backend == "redis":
+        return RedisJobStore(settings.REDIS_URL, ttl_seconds)
+    else:
+        raise ValueError(f"Unsupported job store backend: {backend}")
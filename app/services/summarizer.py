@@ -1,21 +1,52 @@
+import hashlib
 import logging
 import asyncio
-from typing import Dict, List, Tuple, Optional
+
+import openai
+from typing import AsyncIterator, Dict, List, Tuple, Optional
 from datetime import datetime
 
-from app.services.chunker import determine_chunk_size, process_chunks
+from app.config import get_settings
+from app.services.chunker import count_chunks, determine_chunk_size, process_chunks
 from app.services.ai_client import AIClient
-from app.utils.helpers import create_prompt
+from app.utils.helpers import TranscriptColumns
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+async def _progress_writer(queue: asyncio.Queue, update_progress_callback):
+    """
+    Drain queued progress updates and deliver them to the callback.
+
+    Runs as a dedicated task so a slow callback (e.g. one writing to a
+    database) never blocks the summarization pipeline. A None item is
+    the shutdown sentinel.
+
+    Args:
+        queue: The queue of (job_id, status, progress, extras) tuples
+        update_progress_callback: The callback to deliver updates to
+    """
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+
+        job_id, status, progress, extras = item
+        try:
+            if asyncio.iscoroutinefunction(update_progress_callback):
+                await update_progress_callback(job_id, status, progress, **extras)
+            else:
+                # Run sync callbacks off the event loop in case they block
+                await asyncio.to_thread(update_progress_callback, job_id, status, progress, **extras)
+        except Exception as e:
+            logger.error(f"Error delivering progress update: {str(e)}")
+
 class TranscriptSummarizer:
     """
-    Service for summarizing meeting transcripts by breaking them into chunks 
+    Service for summarizing meeting transcripts by breaking them into chunks
     and processing them with AI.
     """
-    
+
     def __init__(self, ai_client: AIClient):
         """
         Initialize the summarizer with an AI client.
@@ -25,87 +56,227 @@ class TranscriptSummarizer:
         """
         self.ai_client = ai_client
     
+    async def _generate_chunk_summaries(
+        self,
+        transcript_data: Dict,
+        emit_progress=None
+    ) -> List[str]:
+        """
+        Generate the per-chunk summaries for a transcript.
+
+        Args:
+            transcript_data: The transcript data containing transcriptions, speakers, and attendees
+            emit_progress: Optional non-blocking function for enqueueing
+                (status, progress) updates
+
+        Returns:
+            The chunk summaries, in transcript order
+        """
+        # Extract data, compacting the utterance dicts into parallel
+        # columns so the per-dict overhead is dropped up front
+        columns = TranscriptColumns(transcript_data['transcriptions'])
+        speakers = transcript_data['speakers']
+        attendees = transcript_data['attendees']
+        total_utterances = len(columns)
+
+        # Update progress if emitter provided
+        if emit_progress:
+            emit_progress("processing", 0.1)
+
+        # Determine chunk size based on total utterances
+        chunk_size = determine_chunk_size(total_utterances)
+        logger.info(f"Total utterances: {total_utterances}")
+        logger.info(f"Using chunk size: {chunk_size}")
+
+        # Process transcript into chunks with prompts, yielded lazily
+        chunk_prompts = process_chunks(columns, chunk_size, speakers, attendees)
+        total_chunks = count_chunks(total_utterances, chunk_size)
+
+        # Deduplicate identical prompts before dispatching: each distinct
+        # prompt is summarized once and the result shared across every
+        # position it appears at, saving redundant LLM calls
+        seen: Dict[bytes, int] = {}
+        unique_prompts: List[str] = []
+        index_groups: List[List[int]] = []
+
+        for position, prompt in enumerate(chunk_prompts):
+            digest = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            if digest in seen:
+                index_groups[seen[digest]].append(position)
+            else:
+                seen[digest] = len(unique_prompts)
+                unique_prompts.append(prompt)
+                index_groups.append([position])
+
+        total_unique = len(unique_prompts)
+        if total_unique < total_chunks:
+            logger.info(f"Deduplicated {total_chunks} chunk prompts down to {total_unique} unique prompts.")
+
+        # Cap concurrent LLM calls so we stay within provider rate limits
+        semaphore = asyncio.Semaphore(get_settings().MAX_CONCURRENCY)
+
+        async def summarize_chunk(index: int, prompt: str) -> Tuple[int, str]:
+            """Generate the summary for a single chunk under the semaphore."""
+            async with semaphore:
+                logger.info(f"Generating summary for chunk {index} of {total_unique}...")
+                summary = await self.ai_client.generate_summary(prompt)
+                logger.info(f"Summary {index} generated.")
+
+            return index, summary
+
+        # Fan out all chunk summaries and collect them in completion order,
+        # so progress advances at true completion events; results are
+        # slotted back into transcript order by index
+        tasks = [
+            asyncio.create_task(summarize_chunk(i, prompt))
+            for i, prompt in enumerate(unique_prompts, 1)
+        ]
+        results: List[Optional[str]] = [None] * total_chunks
+        completed = 0
+
+        # Precompute the progress value for each completion count so the
+        # loop below indexes a tuple instead of redoing float arithmetic
+        progress_steps = tuple(
+            0.1 + 0.7 * k / total_chunks for k in range(1, total_chunks + 1)
+        )
+
+        try:
+            for finished in asyncio.as_completed(tasks):
+                index, summary = await finished
+                for position in index_groups[index - 1]:
+                    results[position] = summary
+                    completed += 1
+
+                if emit_progress:
+                    emit_progress("processing", progress_steps[completed - 1])
+        except Exception:
+            # Don't leave the remaining chunk calls running after a failure
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return results
+
     async def summarize(
-        self, 
-        transcript_data: Dict, 
+        self,
+        transcript_data: Dict,
         job_id: Optional[str] = None,
         update_progress_callback=None
     ) -> Tuple[str, str]:
         """
         Summarize a transcript by breaking it into chunks and then combining the summaries.
-        
+
         Args:
             transcript_data: The transcript data containing transcriptions, speakers, and attendees
             job_id: Optional job ID for tracking progress
             update_progress_callback: Optional callback function to update job progress
-            
+
         Returns:
             A tuple of (final_summary, clean_summaries)
-            
+
         Raises:
             Exception: If any step of the summarization process fails
         """
+        # Progress updates go through a queue drained by a dedicated task,
+        # so a slow callback never blocks the summarization pipeline
+        progress_queue: Optional[asyncio.Queue] = None
+        progress_task = None
+        if update_progress_callback and job_id:
+            progress_queue = asyncio.Queue()
+            progress_task = asyncio.create_task(
+                _progress_writer(progress_queue, update_progress_callback)
+            )
+
+        def emit_progress(status, progress, **extras):
+            if progress_queue is not None:
+                progress_queue.put_nowait((job_id, status, progress, extras))
+
         try:
-            # Extract data
-            utterances = transcript_data['transcriptions']
-            speakers = transcript_data['speakers']
-            attendees = transcript_data['attendees']
-            total_utterances = len(utterances)
-            
-            # Update progress if callback provided
-            if update_progress_callback and job_id:
-                update_progress_callback(job_id, "processing", 0.1)
-            
-            # Determine chunk size based on total utterances
-            chunk_size = determine_chunk_size(total_utterances)
-            logger.info(f"Total utterances: {total_utterances}")
-            logger.info(f"Using chunk size: {chunk_size}")
-            
-            # Process transcript into chunks with prompts
-            chunk_prompts = process_chunks(utterances, chunk_size, speakers, attendees)
-            summaries = []
-            
-            # Process each chunk
-            for i, prompt in enumerate(chunk_prompts, 1):
-                logger.info(f"Generating summary for chunk {i} of {len(chunk_prompts)}...")
-                
-                # Generate summary for the chunk
-                summary = await self.ai_client.generate_summary(prompt)
-                summaries.append(summary)
-                logger.info(f"Summary {i} generated.")
-                
-                # Update progress if callback provided
-                if update_progress_callback and job_id:
-                    progress = 0.1 + (0.7 * (i / len(chunk_prompts)))
-                    update_progress_callback(job_id, "processing", progress)
-            
-            # Combine all chunk summaries
-            clean_summaries = "\n\n".join([f"Summary {i+1}:\n\n{summary}" for i, summary in enumerate(summaries)])
-            
-            logger.info("Generating final summary...")
-            
-            # Generate the final comprehensive summary
-            final_summary = await self.ai_client.generate_final_summary(clean_summaries)
-            
-            # Update progress if callback provided
-            if update_progress_callback and job_id:
-                update_progress_callback(
-                    job_id, 
-                    "completed", 
-                    1.0, 
-                    result={
-                        "final_summary": final_summary,
-                        "clean_summaries": clean_summaries
-                    }
-                )
-            
+            summaries = await self._generate_chunk_summaries(
+                transcript_data,
+                emit_progress=emit_progress
+            )
+
+            # Combine all chunk summaries; a generator avoids building a
+            # throwaway list just to feed join
+            clean_summaries = "\n\n".join(f"Summary {i}:\n\n{summary}" for i, summary in enumerate(summaries, 1))
+
+            if len(summaries) == 1:
+                # A single chunk already covers the whole meeting and obeys
+                # the summary schema, so a second LLM round trip would only
+                # re-summarize it
+                logger.info("Single chunk; using its summary as the final summary.")
+                final_summary = summaries[0]
+            else:
+                logger.info("Generating final summary...")
+
+                # Generate the final comprehensive summary
+                final_summary = await self.ai_client.generate_final_summary(clean_summaries)
+
+            emit_progress(
+                "completed",
+                1.0,
+                result={
+                    "final_summary": final_summary,
+                    "clean_summaries": clean_summaries
+                }
+            )
+
             return final_summary, clean_summaries
-            
+
+        except (ValueError, KeyError) as e:
+            # Expected input errors: log at info with lazy formatting and
+            # skip the full traceback capture
+            logger.info("Invalid transcript input: %s", e)
+            emit_progress("failed", None, error=str(e))
+            raise
+        except openai.OpenAIError as e:
+            # Provider failures (the SDK wraps transport and timeout
+            # errors in its own hierarchy): the message identifies them
+            logger.error("AI provider request failed: %s", e)
+            emit_progress("failed", None, error=str(e))
+            raise
         except Exception as e:
-            logger.error(f"Error in summarize_transcript: {str(e)}")
-            
-            # Update progress if callback provided
-            if update_progress_callback and job_id:
-                update_progress_callback(job_id, "failed", None, error=str(e))
-            
-            raise
\ No newline at end of file
+            # Anything else is unexpected; keep the traceback
+            logger.exception("Error in summarize_transcript")
+            emit_progress("failed", None, error=str(e))
+            raise
+        finally:
+            # Flush remaining updates and stop the writer
+            if progress_queue is not None:
+                progress_queue.put_nowait(None)
+                await progress_task
+
+    async def summarize_stream(self, transcript_data: Dict) -> AsyncIterator[str]:
+        """
+        Summarize a transcript and stream the final summary as it is generated.
+
+        The chunk summaries are generated as in summarize(); the final
+        summary is then yielded piece by piece so callers can forward it
+        to clients without waiting for the full completion.
+
+        Args:
+            transcript_data: The transcript data containing transcriptions, speakers, and attendees
+
+        Yields:
+            Pieces of the final summary
+
+        Raises:
+            Exception: If any step of the summarization process fails
+        """
+        summaries = await self._generate_chunk_summaries(transcript_data)
+
+        if len(summaries) == 1:
+            # Single chunk: its summary is the final summary (see summarize)
+            logger.info("Single chunk; streaming its summary as the final summary.")
+            yield summaries[0]
+            return
+
+        # Combine all chunk summaries; a generator avoids building a
+        # throwaway list just to feed join
+        clean_summaries = "\n\n".join(f"Summary {i}:\n\n{summary}" for i, summary in enumerate(summaries, 1))
+
+        logger.info("Streaming final summary...")
+
+        async for piece in self.ai_client.generate_final_summary_stream(clean_summaries):
+            yield piece
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+Cache of chunk summaries keyed on transcript content.
+
+Recurring meetings (standups, weekly syncs) produce chunks whose
+transcribed content is identical or nearly identical across runs, so
+their summaries can be served without another LLM call. When
+sentence-transformers and faiss are installed, lookups match on
+embedding cosine similarity to also catch near-duplicates; otherwise
+lookups fall back to exact content hashes, which never produce false
+positives.
+"""
+
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import orjson
+
+from app.config import get_settings
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Optional embedding stack for similarity matching
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+# The speaker/attendee suffix varies independently of the spoken content,
+# so only the transcribed portion of the prompt is used as the cache key
+_PROMPT_KEY_DELIMITER = "And the following is the speakers info:"
+
+def extract_cache_key(prompt_text: str) -> str:
+    """
+    Extracts the transcript portion of a chunk prompt for cache keying.
+
+    Args:
+        prompt_text: The full chunk prompt
+
+    Returns:
+        The portion of the prompt that is stable across re-runs
+    """
+    return prompt_text.split(_PROMPT_KEY_DELIMITER, 1)[0]
+
+class SummaryCache:
+    """
+    Content-addressed cache for chunk summaries.
+
+    Exact matches are always served from a hash-keyed dict. When the
+    optional embedding stack is available, a FAISS inner-product index
+    over normalized embeddings additionally serves near-duplicate chunks
+    whose cosine similarity clears the configured threshold.
+    """
+
+    EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.97,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = 10000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for an
+                embedding lookup to count as a hit
+            cache_dir: Optional directory for persisting entries between
+                runs
+            max_entries: Maximum number of entries held; further puts
+                are dropped so a long-lived server stays bounded
+        """
+        self._similarity_threshold = similarity_threshold
+        self._cache_dir = cache_dir
+        self._max_entries = max_entries
+        self._exact: Dict[bytes, str] = {}
+        # Responses aligned one-to-one with the vectors in the FAISS
+        # index; entries only enter both together, so a similarity hit
+        # can never resolve to a different entry's summary
+        self._indexed_responses: List[str] = []
+        self._full_warned = False
+        # get/put may run in worker threads (the async client offloads
+        # them with asyncio.to_thread), so mutations are serialized
+        self._lock = threading.Lock()
+
+        self._model = None
+        self._index = None
+        if EMBEDDINGS_AVAILABLE:
+            # Load the embedding model once; embedding compute is far
+            # cheaper than a generation call
+            self._model = SentenceTransformer(self.EMBEDDING_MODEL)
+            self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+
+        if cache_dir is not None:
+            self._load()
+
+    def _hash(self, key: str) -> bytes:
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+    def _embed(self, key: str):
+        embedding = self._model.encode([key], normalize_embeddings=True)
+        return np.asarray(embedding, dtype="float32")
+
+    def get(self, prompt_text: str) -> Optional[str]:
+        """
+        Look up a cached summary for a chunk prompt.
+
+        Args:
+            prompt_text: The full chunk prompt
+
+        Returns:
+            The cached summary, or None on a miss
+        """
+        key = extract_cache_key(prompt_text)
+
+        with self._lock:
+            cached = self._exact.get(self._hash(key))
+            if cached is not None:
+                return cached
+
+            if self._index is not None and self._index.ntotal > 0:
+                similarities, indices = self._index.search(self._embed(key), 1)
+                if similarities[0][0] >= self._similarity_threshold:
+                    return self._indexed_responses[indices[0][0]]
+
+        return None
+
+    def put(self, prompt_text: str, response: str) -> None:
+        """
+        Store a generated summary for a chunk prompt.
+
+        Args:
+            prompt_text: The full chunk prompt
+            response: The generated summary
+        """
+        key = extract_cache_key(prompt_text)
+
+        with self._lock:
+            if len(self._exact) >= self._max_entries:
+                # FAISS flat indexes do not support removal, so the cache
+                # stops accepting entries rather than growing unbounded
+                if not self._full_warned:
+                    logger.warning(f"Summary cache full ({self._max_entries} entries); new summaries are not cached")
+                    self._full_warned = True
+                return
+
+            self._exact[self._hash(key)] = response
+
+            if self._index is not None:
+                self._index.add(self._embed(key))
+                self._indexed_responses.append(response)
+
+            if self._cache_dir is not None:
+                self._save(key, response)
+
+    def _entries_path(self) -> Path:
+        return self._cache_dir / "summary_cache.jsonl"
+
+    def _load(self) -> None:
+        """
+        Load persisted entries from the cache directory.
+
+        The FAISS index is rebuilt from the stored raw keys with one
+        batched encode rather than persisted separately, so it can never
+        drift out of alignment with the loaded responses.
+        """
+        entries_path = self._entries_path()
+        if not entries_path.exists():
+            return
+
+        keys: List[str] = []
+        responses: List[str] = []
+        with entries_path.open("rb") as f:
+            for line in f:
+                if len(self._exact) >= self._max_entries:
+                    break
+
+                entry = orjson.loads(line)
+                key = entry.get("key")
+                if key is not None:
+                    self._exact[self._hash(key)] = entry["response"]
+                    keys.append(key)
+                    responses.append(entry["response"])
+                else:
+                    # Entry from before raw keys were stored: usable for
+                    # exact lookups only, not for the similarity index
+                    self._exact[bytes.fromhex(entry["key_hash"])] = entry["response"]
+
+        if self._index is not None and keys:
+            embeddings = self._model.encode(keys, normalize_embeddings=True)
+            self._index.add(np.asarray(embeddings, dtype="float32"))
+            self._indexed_responses.extend(responses)
+
+        logger.info(f"Loaded {len(self._exact)} cached chunk summaries")
+
+    def _save(self, key: str, response: str) -> None:
+        """Append an entry to the cache directory."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        entry = {"key": key, "response": response}
+        with self._entries_path().open("ab") as f:
+            f.write(orjson.dumps(entry) + b"\n")
+
+@lru_cache()
+def get_summary_cache() -> Optional[SummaryCache]:
+    """
+    Factory function to get the configured summary cache.
+
+    Returns:
+        The shared SummaryCache instance, or None if caching is disabled
+    """
+    settings = get_settings()
+    if not settings.SUMMARY_CACHE_ENABLED:
+        return None
+
+    cache_dir = Path(settings.SUMMARY_CACHE_DIR) if settings.SUMMARY_CACHE_DIR else None
+    return SummaryCache(
+        settings.SUMMARY_CACHE_SIMILARITY,
+        cache_dir,
+        settings.SUMMARY_CACHE_MAX_ENTRIES
+    )
@@ -4,101 +4,126 @@ Helper utilities for the transcript summarizer.
 This module contains utility functions used across the application.
 """
 
-import json
 import logging
+from array import array
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from app.models import TranscriptData
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def create_prompt(extracted_data: List[Dict[str, Any]], speakers: List[Dict[str, Any]], attendees: List[Dict[str, Any]]) -> str:
+# Template for one transcription entry in a chunk prompt; a single
+# positional format call fills all five fields per utterance
+_ENTRY_TEMPLATE = (
+    "Transcription ID: {}\n"
+    "Speaker ID: {}\n"
+    "Text: {}\n"
+    "Start Time: {}\n"
+    "End Time: {}\n\n"
+)
+
+class TranscriptColumns:
     """
-    Creates a prompt for the AI model based on the transcript data.
-    
+    Column-oriented (struct-of-arrays) view of the transcription entries.
+
+    Five parallel sequences replace the list of per-utterance dicts,
+    avoiding the per-dict overhead (~200 bytes each) for long
+    transcripts and keeping the time fields packed as C doubles.
+    """
+
+    __slots__ = ("transcription_ids", "speaker_ids", "texts", "start_times", "end_times")
+
+    def __init__(self, transcriptions: List[Dict[str, Any]]):
+        """
+        Build the columns from validated transcription dicts.
+
+        Args:
+            transcriptions: The sanitized transcription entries
+        """
+        self.transcription_ids = [t["transcriptionId"] for t in transcriptions]
+        self.speaker_ids = [t["speakerId"] for t in transcriptions]
+        self.texts = [t["text"] for t in transcriptions]
+        self.start_times = array("d", (t["startTime"] for t in transcriptions))
+        self.end_times = array("d", (t["endTime"] for t in transcriptions))
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+def build_static_suffix(speakers: List[Dict[str, Any]], attendees: List[Dict[str, Any]]) -> str:
+    """
+    Builds the speaker/attendee suffix shared by every chunk prompt.
+
+    The suffix is identical for all chunks of a job, so callers format
+    it once and reuse it instead of rebuilding it per chunk.
+
     Args:
-        extracted_data: The transcript data for a chunk
         speakers: The speakers data
         attendees: The attendees data
-        
+
     Returns:
-        The formatted prompt string
+        The formatted suffix string
     """
-    # Start with the transcribed data
-    prompt = "Here is the transcribed data:\n\n"
-    
-    # Add each transcription entry
-    for item in extracted_data:
-        prompt += f"Transcription ID: {item['transcriptionId']}\n"
-        prompt += f"Speaker ID: {item['speakerId']}\n"
-        prompt += f"Text: {item['text']}\n"
-        prompt += f"Start Time: {item['startTime']}\n"
-        prompt += f"End Time: {item['endTime']}\n\n"
-    
-    # Add speaker information
     speaker_info = "\n".join([f"Speaker ID: {s['speakerId']}, Name: {s['name']}" for s in speakers])
-    prompt += f"And the following is the speakers info:\n{speaker_info}\n\n"
-    
-    # Add attendee information
     attendee_info = "\n".join([f"Attendee ID: {a['attendeeId']}, Email: {a['email']}" for a in attendees])
-    prompt += f"And the following is the attendee info:\n{attendee_info}"
-    
-    return prompt
+
+    return (
+        f"And the following is the speakers info:\n{speaker_info}\n\n"
+        f"And the following is the attendee info:\n{attendee_info}"
+    )
+
+def create_prompt(columns: TranscriptColumns, start: int, end: int, static_suffix: str) -> str:
+    """
+    Creates a prompt for the AI model from a window of the transcript.
+
+    Args:
+        columns: The column-oriented transcript data
+        start: The index of the first utterance in the window
+        end: The index one past the last utterance in the window
+        static_suffix: The pre-built speaker/attendee suffix
+
+    Returns:
+        The formatted prompt string
+    """
+    # Collect the pieces in a list and join once at the end, rather than
+    # growing a string with repeated concatenation
+    parts = ["Here is the transcribed data:\n\n"]
+    append_ = parts.append
+
+    # Add each transcription entry, walking the columns in lockstep
+    for entry in zip(
+        columns.transcription_ids[start:end],
+        columns.speaker_ids[start:end],
+        columns.texts[start:end],
+        columns.start_times[start:end],
+        columns.end_times[start:end]
+    ):
+        append_(_ENTRY_TEMPLATE.format(*entry))
+
+    parts.append(static_suffix)
+
+    return "".join(parts)
 
 def sanitize_transcript_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Sanitizes transcript data by ensuring all required fields are present and properly formatted.
-    
+
+    Validation runs through the TranscriptData Pydantic model, so the
+    per-field checks (including string-to-float coercion of the time
+    fields) execute in pydantic-core rather than Python-level loops.
+
     Args:
         data: The raw transcript data
-        
+
     Returns:
         The sanitized transcript data
-        
+
     Raises:
         ValueError: If required fields are missing or improperly formatted
+            (pydantic.ValidationError is a ValueError subclass)
     """
-    # Check for required top-level keys
-    required_keys = ["transcriptions", "speakers", "attendees"]
-    for key in required_keys:
-        if key not in data:
-            raise ValueError(f"Missing required field: {key}")
-    
-    # Ensure transcriptions is a list
-    if not isinstance(data["transcriptions"], list):
-        raise ValueError("'transcriptions' must be a list")
-    
-    # Ensure each transcription has required fields
-    for i, transcription in enumerate(data["transcriptions"]):
-        required_trans_fields = ["transcriptionId", "speakerId", "text", "startTime", "endTime"]
-        for field in required_trans_fields:
-            if field not in transcription:
-                raise ValueError(f"Transcription at index {i} is missing required field: {field}")
-        
-        # Convert time fields to float if they're strings
-        for time_field in ["startTime", "endTime"]:
-            if isinstance(transcription[time_field], str):
-                try:
-                    transcription[time_field] = float(transcription[time_field])
-                except ValueError:
-                    raise ValueError(f"Invalid {time_field} value in transcription at index {i}")
-    
-    # Ensure speakers and attendees are lists
-    for field in ["speakers", "attendees"]:
-        if not isinstance(data[field], list):
-            raise ValueError(f"'{field}' must be a list")
-    
-    # Ensure each speaker has required fields
-    for i, speaker in enumerate(data["speakers"]):
-        if "speakerId" not in speaker or "name" not in speaker:
-            raise ValueError(f"Speaker at index {i} is missing required fields")
-    
-    # Ensure each attendee has required fields
-    for i, attendee in enumerate(data["attendees"]):
-        if "attendeeId" not in attendee or "email" not in attendee:
-            raise ValueError(f"Attendee at index {i} is missing required fields")
-    
-    return data
+    return TranscriptData.model_validate(data).model_dump()
 
 def format_time(seconds: float) -> str:
     """
@@ -1,14 +1,34 @@
+import logging
+
 import uvicorn
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 if __name__ == "__main__":
     # Get application settings
     settings = get_settings()
-    
-    # Start the uvicorn server
+
+    workers = 1 if settings.DEBUG else settings.WORKERS
+    if workers > 1 and settings.JOB_STORE_BACKEND != "redis":
+        # The in-memory job store is per-process: a job created in one
+        # worker would 404 in every other, so refuse to fan out
+        logger.warning(
+            "WORKERS=%d requires JOB_STORE_BACKEND=redis; "
+            "falling back to a single worker", workers
+        )
+        workers = 1
+
+    # Start the uvicorn server. Production runs use the uvloop event
+    # loop and the httptools HTTP parser; debug mode keeps a single
+    # reload-friendly worker on the default loop.
     uvicorn.run(
-        "app.main:app", 
-        host=settings.HOST, 
-        port=settings.PORT, 
-        reload=settings.DEBUG
+        "app.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        reload=settings.DEBUG,
+        loop="auto" if settings.DEBUG else "uvloop",
+        http="httptools",
+        workers=workers,
+        log_config=None
     )
\ No newline at end of file